@@ -7,15 +7,23 @@ via the Anthropic API.
 from __future__ import annotations
 
 import os
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from dotenv import load_dotenv
 
 from .models import AsinRecord, BrandRecord, CategoryAuditData, SearchTermRecord
 
 DEFAULT_MODEL = "claude-sonnet-4-6"
+_MAX_TOKENS = 12000
+_BATCH_POLL_SECONDS = 30
 
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 
@@ -30,21 +38,65 @@ _SECTION_TEMPLATES = {
 }
 
 
+def _read_text(path: str) -> str:
+    """Read and strip a prompt file (callers cache the result)."""
+    return Path(path).read_text(encoding="utf-8").strip()
+
+
+@lru_cache(maxsize=None)
 def _load_prompt(filename: str) -> str:
-    return (_PROMPTS_DIR / filename).read_text(encoding="utf-8").strip()
+    """Read a prompt file once per process."""
+    return _read_text(str(_PROMPTS_DIR / filename))
+
+
+def _system_prompt() -> str:
+    return _load_prompt("system_prompt.txt")
+
+
+_PLACEHOLDER_RE = re.compile(r"\[Brand Name\]|\[retailer\]|\[Retailer\]")
+
+
+@dataclass(frozen=True)
+class _CompiledTemplate:
+    """Section template text plus the placeholder pattern used to fill it."""
+
+    text: str
+    pattern: re.Pattern = _PLACEHOLDER_RE
+
+    def render(self, subs: Dict[str, str]) -> str:
+        """Substitute every known placeholder in one pass.
 
+        Placeholders without an entry in ``subs`` are left as-is.
+        """
+        if not subs:
+            return self.text
+        return self.pattern.sub(lambda m: subs.get(m.group(0), m.group(0)), self.text)
 
-def _load_template(report_type: str, style: str = "ross") -> str:
+
+@lru_cache(maxsize=None)
+def _load_template(report_type: str, style: str = "ross") -> _CompiledTemplate:
     """Load a section template, respecting style choice.
 
     Styles are stored in prompts/styles/{type}_{style}.txt.
     The default files in prompts/ are always the current active style.
+    The resolved template is remembered per (report_type, style), so the
+    style-file probe and the read run once.
     """
     style_file = _PROMPTS_DIR / "styles" / f"{report_type}_{style}.txt"
-    if style_file.exists():
-        return style_file.read_text(encoding="utf-8").strip()
-    # Fall back to the default template
-    return _load_prompt(_SECTION_TEMPLATES[report_type])
+    if not style_file.exists():
+        # Fall back to the default template
+        style_file = _PROMPTS_DIR / _SECTION_TEMPLATES[report_type]
+    return _CompiledTemplate(_read_text(str(style_file)))
+
+
+def preload_templates(
+    report_types: Tuple[str, ...] = ("prospect", "brand", "buyer"),
+    styles: Tuple[str, ...] = ("ross", "expo"),
+) -> None:
+    """Resolve and read section templates up front (call once per batch)."""
+    for report_type in report_types:
+        for style in styles:
+            _load_template(report_type, style)
 
 
 # ---------------------------------------------------------------------------
@@ -52,49 +104,54 @@ def _load_template(report_type: str, style: str = "ross") -> str:
 # ---------------------------------------------------------------------------
 
 
+_BRAND_HEADER = (
+    f"{'#':>3} {'Brand':<30} {'TTM Revenue':>14} {'Share%':>7} "
+    f"{'YoY%':>7} {'Delta BP':>9} {'Products':>9} {'Avg $':>7} {'Rating':>6}"
+)
+_BRAND_ROW_FMT = "{:>3} {:<30} ${:>12,.0f} {:>6.1f}% {:>+6.1f}% {:>9} {:>9} ${:>5.2f} {:>5.1f}"
+
+_ASIN_HEADER = (
+    f"{'#':>3} {'ASIN':<12} {'Brand':<22} {'Est. Mo. Rev':>13} "
+    f"{'Units':>7} {'Price':>7} {'Reviews':>8} {'Rating':>6} Title"
+)
+_ASIN_ROW_FMT = "{:>3} {:<12} {:<22} ${:>11,.0f} {:>7,} ${:>5.2f} {:>8,} {:>5.1f}  {}"
+
+_TERM_HEADER = f"{'#':>3} {'Search Term':<40} {'Est. Monthly Vol':>17} {'CPC':>6}"
+_TERM_ROW_FMT = "{:>3} {:<40} {:>17,} ${:>5.2f}"
+
+
 def _format_brands_table(brands: List[BrandRecord], limit: int = 20) -> str:
-    lines = [
-        f"{'#':>3} {'Brand':<30} {'TTM Revenue':>14} {'Share%':>7} "
-        f"{'YoY%':>7} {'Delta BP':>9} {'Products':>9} {'Avg $':>7} {'Rating':>6}"
-    ]
-    lines.append("-" * len(lines[0]))
-    for i, b in enumerate(brands[:limit], 1):
-        delta = f"{b.share_delta_bp:+.0f}" if b.share_delta_bp is not None else "n/a"
-        lines.append(
-            f"{i:>3} {b.name:<30} ${b.trailing_12_months:>12,.0f} "
-            f"{b.share_pct:>6.1f}% {b.month_growth_12:>+6.1f}% "
-            f"{delta:>9} {b.total_products:>9} ${b.avg_price:>5.2f} "
-            f"{b.review_rating:>5.1f}"
+    fmt = _BRAND_ROW_FMT.format
+    rows = [
+        fmt(
+            i, b.name, b.trailing_12_months, b.share_pct, b.month_growth_12,
+            f"{b.share_delta_bp:+.0f}" if b.share_delta_bp is not None else "n/a",
+            b.total_products, b.avg_price, b.review_rating,
         )
-    return "\n".join(lines)
+        for i, b in enumerate(brands[:limit], 1)
+    ]
+    return "\n".join([_BRAND_HEADER, "-" * len(_BRAND_HEADER), *rows])
 
 
 def _format_asins_table(asins: List[AsinRecord], limit: int = 50) -> str:
-    lines = [
-        f"{'#':>3} {'ASIN':<12} {'Brand':<22} {'Est. Mo. Rev':>13} "
-        f"{'Units':>7} {'Price':>7} {'Reviews':>8} {'Rating':>6} Title"
-    ]
-    lines.append("-" * 120)
-    for i, a in enumerate(asins[:limit], 1):
-        lines.append(
-            f"{i:>3} {a.asin:<12} {a.brand[:21]:<22} "
-            f"${a.monthly_revenue_est:>11,.0f} {a.monthly_units_est:>7,} "
-            f"${a.price:>5.2f} {a.review_count:>8,} {a.review_rating:>5.1f}  "
-            f"{a.title[:60]}"
+    fmt = _ASIN_ROW_FMT.format
+    rows = [
+        fmt(
+            i, a.asin, a.brand[:21], a.monthly_revenue_est, a.monthly_units_est,
+            a.price, a.review_count, a.review_rating, a.title[:60],
         )
-    return "\n".join(lines)
+        for i, a in enumerate(asins[:limit], 1)
+    ]
+    return "\n".join([_ASIN_HEADER, "-" * 120, *rows])
 
 
 def _format_search_terms(terms: List[SearchTermRecord], limit: int = 30) -> str:
-    lines = [
-        f"{'#':>3} {'Search Term':<40} {'Est. Monthly Vol':>17} {'CPC':>6}"
+    fmt = _TERM_ROW_FMT.format
+    rows = [
+        fmt(i, t.term, t.monthly_volume, t.cpc)
+        for i, t in enumerate(terms[:limit], 1)
     ]
-    lines.append("-" * 70)
-    for i, t in enumerate(terms[:limit], 1):
-        lines.append(
-            f"{i:>3} {t.term:<40} {t.monthly_volume:>17,} ${t.cpc:>5.2f}"
-        )
-    return "\n".join(lines)
+    return "\n".join([_TERM_HEADER, "-" * 70, *rows])
 
 
 # ---------------------------------------------------------------------------
@@ -104,16 +161,13 @@ def _format_search_terms(terms: List[SearchTermRecord], limit: int = 30) -> str:
 
 def build_analysis_prompt(data: CategoryAuditData, style: str = "ross") -> str:
     """Build the full user prompt from assembled data."""
-    section_template = _load_template(data.report_type, style)
-
-    # Replace [Brand Name] placeholder in templates
+    # Replace [Brand Name] / [retailer] placeholders in templates
+    subs: Dict[str, str] = {}
     if data.target_brand:
-        section_template = section_template.replace(
-            "[Brand Name]", data.target_brand
-        )
+        subs["[Brand Name]"] = data.target_brand
     if data.retailer:
-        section_template = section_template.replace("[retailer]", data.retailer)
-        section_template = section_template.replace("[Retailer]", data.retailer)
+        subs["[retailer]"] = subs["[Retailer]"] = data.retailer
+    section_template = _load_template(data.report_type, style).render(subs)
 
     prior_rev = (
         f"${data.total_category_revenue_prior:,.0f}"
@@ -143,16 +197,16 @@ CATEGORY FINANCIALS:
 - YoY Growth (revenue-weighted avg): {data.yoy_growth_pct:+.1f}%
 
 BRAND LANDSCAPE (sorted by TTM revenue, with computed share):
-{_format_brands_table(data.brands[:20])}
+{_format_brands_table(data.brands)}
 (share_delta_bp = basis points change, TTM vs prior 12 months; "n/a" = not computed for this report type)
 Note: share % is relative to tracked brand set, not absolute Amazon category share.
 
 TOP ASINs by estimated monthly revenue:
-{_format_asins_table(data.top_asins[:50])}
+{_format_asins_table(data.top_asins)}
 {brand_asins_section}
 
 TOP SEARCH TERMS by estimated monthly volume:
-{_format_search_terms(data.search_terms[:30])}
+{_format_search_terms(data.search_terms)}
 
 REQUIRED SECTIONS:
 {section_template}
@@ -169,6 +223,39 @@ IMPORTANT:
 # Analysis runner
 # ---------------------------------------------------------------------------
 
+_ENV_LOADED = False
+
+
+def _ensure_env():
+    """Load .env once per process.
+
+    override=True is required: Claude Code sets an empty ANTHROPIC_API_KEY
+    in the environment, which would otherwise shadow the .env value.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv(override=True)
+        _ENV_LOADED = True
+
+
+def _api_key() -> str:
+    _ensure_env()
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise RuntimeError("ANTHROPIC_API_KEY not found in environment")
+    return api_key
+
+
+_CLIENT: Anthropic | None = None
+
+
+def _get_client() -> Anthropic:
+    """Shared sync client, so HTTP keep-alive spans every call in a process."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = Anthropic(api_key=_api_key())
+    return _CLIENT
+
 
 def analyze(
     data: CategoryAuditData,
@@ -176,13 +263,8 @@ def analyze(
     style: str = "ross",
 ) -> str:
     """Send data to Claude and return markdown analysis."""
-    load_dotenv(override=True)
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise RuntimeError("ANTHROPIC_API_KEY not found in environment")
-
-    client = Anthropic(api_key=api_key)
-    system_prompt = _load_prompt("system_prompt.txt")
+    client = _get_client()
+    system_prompt = _system_prompt()
     user_prompt = build_analysis_prompt(data, style=style)
 
     print(f"[analyze] Sending to {model}...")
@@ -190,7 +272,7 @@ def analyze(
 
     response = client.messages.create(
         model=model,
-        max_tokens=12000,
+        max_tokens=_MAX_TOKENS,
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
     )
@@ -198,3 +280,91 @@ def analyze(
     result = response.content[0].text
     print(f"[analyze] Done. Response: ~{len(result):,} chars")
     return result
+
+
+async def analyze_async(
+    data: CategoryAuditData,
+    model: str = DEFAULT_MODEL,
+    style: str = "ross",
+    client: AsyncAnthropic | None = None,
+) -> str:
+    """Async variant of analyze() for concurrent batch runs.
+
+    Pass a shared ``AsyncAnthropic`` client so every in-flight request
+    reuses one connection pool. Without one, a client is opened for this
+    call and closed when it returns. Concurrency limits are the caller's
+    job.
+    """
+    if client is None:
+        async with AsyncAnthropic(api_key=_api_key()) as own_client:
+            return await analyze_async(data, model, style, client=own_client)
+
+    system_prompt = _system_prompt()
+    user_prompt = build_analysis_prompt(data, style=style)
+
+    label = data.target_brand or data.subcategory_name
+    print(f"[analyze] {label}: sending to {model} (~{len(user_prompt):,} chars)")
+
+    response = await client.messages.create(
+        model=model,
+        max_tokens=_MAX_TOKENS,
+        system=system_prompt,
+        messages=[{"role": "user", "content": user_prompt}],
+    )
+
+    result = response.content[0].text
+    print(f"[analyze] {label}: done. Response: ~{len(result):,} chars")
+    return result
+
+
+def analyze_batch(
+    datas: Dict[str, CategoryAuditData],
+    model: str = DEFAULT_MODEL,
+    style: str = "ross",
+) -> Dict[str, str]:
+    """Run many analyses through the Message Batches API (50% token cost).
+
+    ``datas`` maps a custom_id (letters, digits, ``-``/``_``) to its data.
+    Blocks until the batch ends, then returns ``{custom_id: markdown}``
+    for every request that succeeded. Failed requests are reported and
+    left out of the result.
+    """
+    client = _get_client()
+    system_prompt = _system_prompt()
+
+    requests = [
+        Request(
+            custom_id=custom_id,
+            params=MessageCreateParamsNonStreaming(
+                model=model,
+                max_tokens=_MAX_TOKENS,
+                system=system_prompt,
+                messages=[
+                    {"role": "user", "content": build_analysis_prompt(data, style=style)}
+                ],
+            ),
+        )
+        for custom_id, data in datas.items()
+    ]
+
+    batch = client.messages.batches.create(requests=requests)
+    print(f"[analyze] Submitted batch {batch.id} ({len(requests)} requests) to {model}")
+
+    while batch.processing_status != "ended":
+        time.sleep(_BATCH_POLL_SECONDS)
+        batch = client.messages.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        print(
+            f"  [batch] {batch.processing_status}: {counts.processing} processing, "
+            f"{counts.succeeded} succeeded, {counts.errored} errored"
+        )
+
+    results: Dict[str, str] = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            print(f"  [batch] {entry.custom_id}: {entry.result.type}")
+
+    print(f"[analyze] Batch done. {len(results)}/{len(requests)} succeeded")
+    return results
@@ -13,14 +13,35 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import heapq
+import html
 import json
+import logging
+import mmap
 import os
 import re
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup — falls back to stdlib json
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
 # Paths
@@ -29,21 +50,59 @@ _APP_DIR = _PROJECT_ROOT / "Expo_west" / "enhancements" / "expo-west-app"
 _DEFAULT_OUTPUT = str(_APP_DIR / "intel")
 
 
+def _find_array_end(buf, start: int) -> int:
+    """Return the index of the ``]`` that closes the array opening at ``start``.
+
+    Tracks bracket depth outside JSON strings; string bodies are skipped
+    with ``find`` so escaped quotes and brackets inside names are ignored.
+    """
+    depth = 0
+    i = start
+    n = len(buf)
+    while i < n:
+        c = buf[i]
+        if c == 0x22:  # '"' — jump to the closing quote
+            i += 1
+            while True:
+                i = buf.find(b'"', i)
+                if i == -1:
+                    return -1
+                j = i - 1
+                while buf[j] == 0x5C:  # count preceding backslashes
+                    j -= 1
+                if (i - 1 - j) % 2 == 0:
+                    break
+                i += 1
+        elif c == 0x5B:  # '['
+            depth += 1
+        elif c == 0x5D:  # ']'
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return -1
+
+
 def _extract_brands_from_html(html_path: str) -> list:
     """Extract the BRANDS array from the app's index.html."""
-    with open(html_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Find the BRANDS array: const BRANDS=[...];
-    match = re.search(r"const BRANDS\s*=\s*(\[.*?\]);\s*\n", content, re.DOTALL)
-    if not match:
-        raise RuntimeError(f"Could not find BRANDS array in {html_path}")
+    with open(html_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            raise RuntimeError(f"Could not find BRANDS array in {html_path}")
+
+    with mm:
+        # Find the BRANDS array: const BRANDS=[...];
+        idx = mm.find(b"const BRANDS")
+        start = mm.find(b"[", idx) if idx != -1 else -1
+        end = _find_array_end(mm, start) if start != -1 else -1
+        if end == -1:
+            raise RuntimeError(f"Could not find BRANDS array in {html_path}")
 
-    brands_json = match.group(1)
-    try:
-        brands = json.loads(brands_json)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse BRANDS JSON: {e}")
+        try:
+            brands = _json_loads(mm[start:end + 1])
+        except ValueError as e:
+            raise RuntimeError(f"Failed to parse BRANDS JSON: {e}")
 
     print(f"[brands] Extracted {len(brands)} brands from {html_path}")
     return brands
@@ -51,32 +110,87 @@ def _extract_brands_from_html(html_path: str) -> list:
 
 def _extract_brands_from_json(json_path: str) -> list:
     """Extract brands from app_data.json."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        brands = json.load(f)
+    brands = _json_loads(Path(json_path).read_bytes())
     print(f"[brands] Loaded {len(brands)} brands from {json_path}")
     return brands
 
 
+def _is_eligible(b: dict, min_revenue: float) -> bool:
+    """Brand has a SmartScout match and meets the L12M revenue threshold."""
+    return bool(b.get("matchedBrand")) and (b.get("l12mRaw") or 0) >= min_revenue
+
+
+def _revenue_key(b: dict) -> float:
+    return b.get("l12mRaw") or 0
+
+
 def _slugify(name: str) -> str:
     return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
 
 
+def _render_hash(markdown: str, data) -> str:
+    """Content hash of everything generate_html renders for one report."""
+    from .html_formatter import _CSS_HASH
+
+    h = hashlib.sha256(markdown.encode("utf-8"))
+    h.update(
+        f"\0{data.target_brand}\0{data.subcategory_name}"
+        f"\0{data.total_category_revenue_ttm}\0{data.data_pulled_at:%Y-%m}"
+        # Pages link the stylesheet by hash, so a CSS edit must re-render them
+        f"\0{_CSS_HASH}".encode("utf-8")
+    )
+    return h.hexdigest()[:16]
+
+
+def _render_and_save(slug: str, markdown: str, data, output_dir: str) -> str:
+    """Write {slug}.md and render {slug}.html; returns the HTML path.
+
+    Top-level so it can run in a ProcessPoolExecutor worker.
+    """
+    from .html_formatter import generate_html
+
+    # Save markdown for debugging
+    md_path = os.path.join(output_dir, f"{slug}.md")
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write(markdown)
+
+    # Skip re-rendering when neither the markdown nor the header data changed
+    html_path = os.path.join(output_dir, f"{slug}.html")
+    sha_path = html_path + ".sha"
+    md_hash = _render_hash(markdown, data)
+    try:
+        with open(sha_path, "r", encoding="utf-8") as f:
+            prior_hash = f.read().strip()
+    except FileNotFoundError:
+        prior_hash = None
+    if prior_hash == md_hash and os.path.exists(html_path):
+        print(f"  [cache] html hit: {slug}")
+        return html_path
+
+    html_path = generate_html(markdown, data, output_dir=output_dir)
+    with open(sha_path, "w", encoding="utf-8") as f:
+        f.write(md_hash)
+    return html_path
+
+
 def _generate_index_page(reports: list, output_dir: str):
     """Generate intel/index.html listing all reports."""
-    reports_sorted = sorted(reports, key=lambda r: r.get("l12m_raw", 0), reverse=True)
+    # Every report dict sets "l12m_raw", so a C-level itemgetter is safe here
+    reports_sorted = sorted(reports, key=itemgetter("l12m_raw"), reverse=True)
 
-    rows = ""
+    row_parts = []
     for r in reports_sorted:
         rev = f"${r['l12m_raw']:,.0f}" if r.get("l12m_raw") else "N/A"
-        rows += (
+        row_parts.append(
             f'<tr>'
-            f'<td><a href="{r["slug"]}.html">{r["brand"]}</a></td>'
+            f'<td><a href="{r["slug"]}.html">{html.escape(r["brand"])}</a></td>'
             f'<td>{rev}</td>'
-            f'<td>{r.get("category", "")}</td>'
+            f'<td>{html.escape(r.get("category", ""))}</td>'
             f'</tr>\n'
         )
+    rows = "".join(row_parts)
 
-    html = f"""<!DOCTYPE html>
+    page = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -157,7 +271,7 @@ function filterTable(q) {{
 
     path = os.path.join(output_dir, "index.html")
     with open(path, "w", encoding="utf-8") as f:
-        f.write(html)
+        f.write(page)
     print(f"[index] Generated {path} with {len(reports)} reports")
 
 
@@ -170,8 +284,8 @@ def _generate_manifest(reports: list, output_dir: str):
         manifest[r["brand"].lower()] = r["slug"]
 
     path = os.path.join(output_dir, "manifest.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(_json_dumps(manifest))
     print(f"[manifest] Generated {path} with {len(reports)} entries")
 
 
@@ -212,45 +326,62 @@ def main():
         choices=["auto", "html", "json"],
         help="Brand data source: 'html' (index.html), 'json' (app_data.json), 'auto' (try json first)"
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=5,
+        help="Max concurrent Claude requests (default: 5)"
+    )
+    parser.add_argument(
+        "--batch-mode", action="store_true",
+        help="Submit all analyses as one Message Batches API job (half price, slower turnaround)"
+    )
 
     args = parser.parse_args()
+    # Collector progress goes through logging; show it on stdout as before
+    # (INFO for this package only — httpx logs every request at INFO)
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger("category_audits").setLevel(logging.INFO)
 
     # Load brands
     app_html = str(_APP_DIR / "index.html")
     app_json = str(_APP_DIR.parent / "app_data.json")
 
-    if args.data_source == "json" or (args.data_source == "auto" and os.path.exists(app_json)):
-        brands = _extract_brands_from_json(app_json)
-    elif os.path.exists(app_html):
-        brands = _extract_brands_from_html(app_html)
-    else:
-        print(f"ERROR: No brand data found. Checked:\n  {app_json}\n  {app_html}")
-        sys.exit(1)
+    brands = None
+    if args.data_source in ("auto", "json"):
+        try:
+            brands = _extract_brands_from_json(app_json)
+        except FileNotFoundError:
+            if args.data_source == "json":
+                raise
+    if brands is None:
+        try:
+            brands = _extract_brands_from_html(app_html)
+        except FileNotFoundError:
+            print(f"ERROR: No brand data found. Checked:\n  {app_json}\n  {app_html}")
+            sys.exit(1)
 
     # Filter: must have matchedBrand and meet revenue threshold
-    eligible = [
-        b for b in brands
-        if b.get("matchedBrand")
-        and (b.get("l12mRaw") or 0) >= args.min_revenue
-    ]
+    eligible = [b for b in brands if _is_eligible(b, args.min_revenue)]
     print(f"[filter] {len(eligible)} brands with matchedBrand and L12M >= ${args.min_revenue:,.0f}")
 
     # Single brand mode
     if args.brand:
-        target = args.brand.lower()
-        eligible = [
-            b for b in eligible
-            if b.get("matchedBrand", "").lower() == target
-            or b.get("company", "").lower() == target
-        ]
-        if not eligible:
+        # Lowercased matchedBrand/company → brand; reversed so that the
+        # first entry in the source list wins on duplicate names
+        lookup = {
+            name.lower(): b
+            for b in reversed(eligible)
+            for name in (b.get("matchedBrand"), b.get("company"))
+            if name
+        }
+        match = lookup.get(args.brand.lower())
+        if match is None:
             print(f"ERROR: Brand '{args.brand}' not found in eligible brands")
             sys.exit(1)
-        print(f"[single] Processing: {eligible[0]['company']}")
+        eligible = [match]
+        print(f"[single] Processing: {match['company']}")
     else:
-        # Sort by revenue descending, take top N
-        eligible.sort(key=lambda b: b.get("l12mRaw", 0), reverse=True)
-        eligible = eligible[:args.top]
+        # Top N by revenue descending — partial heap select, no full sort
+        eligible = heapq.nlargest(args.top, eligible, key=_revenue_key)
         print(f"[batch] Processing top {len(eligible)} brands by L12M revenue")
 
     # Lazy imports (so --help is fast)
@@ -259,84 +390,189 @@ def main():
 
     from .cache import load_cached, save_cache
     from .data_collector import CategoryDataCollector
-    from .analyzer import analyze
-    from .html_formatter import generate_html
+    from .analyzer import analyze_async, analyze_batch, preload_templates
+
+    preload_templates()
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not args.dry_run and not api_key:
+        print("ERROR: ANTHROPIC_API_KEY not found in environment")
+        sys.exit(1)
 
     collector = CategoryDataCollector(marketplace="US")
     os.makedirs(args.output_dir, exist_ok=True)
 
+    # (eligible index, entry): brands finish in any order, so both lists
+    # are sorted by index before the index page, manifest and summary
     reports = []
     errors = []
     total = len(eligible)
 
-    for idx, brand_info in enumerate(eligible, 1):
+    async def _load_data(matched: str):
+        """Phase 1: Data collection (with cache).
+
+        Runs inside `async with collector`, so every brand shares one
+        SmartScout connection pool instead of reconnecting per brand.
+        """
+        data = None
+        if not args.skip_cache:
+            data = await asyncio.to_thread(load_cached, "prospect", matched, None, "US")
+
+        if data is None:
+            print(f"  [data] Pulling SmartScout data for '{matched}'...")
+            data = await collector.collect_async(
+                report_type="prospect",
+                brand_name=matched,
+                force_refresh=args.skip_cache,
+            )
+            await asyncio.to_thread(save_cache, data)
+        else:
+            print(f"  [data] Using cached data")
+        return data
+
+    async def _process_brand(idx, brand_info, sem, data_lock, client):
         company = brand_info["company"]
         matched = brand_info["matchedBrand"]
         l12m = brand_info.get("l12mRaw", 0)
         category = brand_info.get("category", "")
         slug = _slugify(matched)
 
-        print(f"\n{'='*60}")
-        print(f"[{idx}/{total}] {company} (matched: {matched})")
-        print(f"  L12M: ${l12m:,.0f} | Category: {category}")
-        print(f"{'='*60}")
-
         try:
-            # Phase 1: Data collection (with cache)
-            data = None
-            if not args.skip_cache:
-                data = load_cached("prospect", matched, None, "US")
-
-            if data is None:
-                print(f"  [data] Pulling SmartScout data for '{matched}'...")
-                data = collector.collect(
-                    report_type="prospect",
-                    brand_name=matched,
-                )
-                save_cache(data)
-            else:
-                print(f"  [data] Using cached data")
-
-            if args.dry_run:
-                print(f"  [dry-run] Skipping analysis")
-                reports.append({
-                    "brand": company,
-                    "matched": matched,
-                    "slug": slug,
-                    "l12m_raw": l12m,
-                    "category": category,
-                })
-                continue
-
-            # Phase 2: Claude analysis
-            print(f"  [analyze] Sending to {args.model}...")
-            markdown = analyze(data, model=args.model, style="expo")
-
-            # Save markdown for debugging
-            md_path = os.path.join(args.output_dir, f"{slug}.md")
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(markdown)
-
-            # Phase 3: HTML report
-            html_path = generate_html(markdown, data, output_dir=args.output_dir)
-            print(f"  [done] {html_path}")
-
-            reports.append({
+            # SmartScout rate limits aggressively — pull one brand at a time.
+            # Claude calls for earlier brands keep running meanwhile.
+            async with data_lock:
+                print(f"\n{'='*60}")
+                print(f"[{idx}/{total}] {company} (matched: {matched})")
+                print(f"  L12M: ${l12m:,.0f} | Category: {category}")
+                print(f"{'='*60}")
+                data = await _load_data(matched)
+
+            report = {
                 "brand": company,
                 "matched": matched,
                 "slug": slug,
                 "l12m_raw": l12m,
                 "category": category,
-            })
+            }
 
-            # Courtesy delay between Claude calls
-            if idx < total:
-                time.sleep(2)
+            if args.dry_run:
+                print(f"  [dry-run] Skipping analysis")
+                reports.append((idx, report))
+                return
+
+            # Phase 2: Claude analysis — at most --concurrency in flight
+            async with sem:
+                markdown = await analyze_async(
+                    data, model=args.model, style="expo", client=client
+                )
+
+            # Phase 3: HTML report — rendered off the event loop in a worker process
+            html_path = await asyncio.get_running_loop().run_in_executor(
+                pool, _render_and_save, slug, markdown, data, args.output_dir
+            )
+            print(f"  [done] {html_path}")
+            reports.append((idx, report))
 
         except Exception as e:
             print(f"  [ERROR] {company}: {e}")
-            errors.append({"brand": company, "error": str(e)})
-            continue
+            errors.append((idx, {"brand": company, "error": str(e)}))
+
+    async def _run():
+        import httpx
+        from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+        # One pool for the whole run; keep-alive sized to the concurrency cap
+        client = None if args.dry_run else AsyncAnthropic(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=max(args.concurrency, 20),
+                    max_keepalive_connections=max(args.concurrency, 20),
+                )
+            ),
+        )
+        sem = asyncio.Semaphore(args.concurrency)
+        data_lock = asyncio.Lock()
+        try:
+            async with collector:
+                await asyncio.gather(*[
+                    asyncio.create_task(_process_brand(idx, b, sem, data_lock, client))
+                    for idx, b in enumerate(eligible, 1)
+                ])
+        finally:
+            if client is not None:
+                await client.close()
+
+    def _run_batch():
+        """Pull data for every brand, then analyze them in one batch job."""
+        pending = {}  # custom_id -> (idx, brand_info, data)
+
+        async def _load_all():
+            async with collector:
+                for idx, brand_info in enumerate(eligible, 1):
+                    company = brand_info["company"]
+                    matched = brand_info["matchedBrand"]
+                    print(f"\n[{idx}/{total}] {company} (matched: {matched})")
+                    try:
+                        pending[f"brand-{idx}"] = (idx, brand_info, await _load_data(matched))
+                    except Exception as e:
+                        print(f"  [ERROR] {company}: {e}")
+                        errors.append((idx, {"brand": company, "error": str(e)}))
+
+        asyncio.run(_load_all())
+
+        if not pending:
+            return
+
+        results = analyze_batch(
+            {cid: data for cid, (_, _, data) in pending.items()},
+            model=args.model,
+            style="expo",
+        )
+
+        futures = {
+            cid: pool.submit(
+                _render_and_save,
+                _slugify(brand_info["matchedBrand"]),
+                results[cid],
+                data,
+                args.output_dir,
+            )
+            for cid, (_, brand_info, data) in pending.items()
+            if cid in results
+        }
+
+        for cid, (idx, brand_info, data) in pending.items():
+            company = brand_info["company"]
+            matched = brand_info["matchedBrand"]
+            if cid not in futures:
+                errors.append((idx, {"brand": company, "error": "batch request did not succeed"}))
+                continue
+            try:
+                slug = _slugify(matched)
+                html_path = futures[cid].result()
+                print(f"  [done] {html_path}")
+                reports.append((idx, {
+                    "brand": company,
+                    "matched": matched,
+                    "slug": slug,
+                    "l12m_raw": brand_info.get("l12mRaw", 0),
+                    "category": brand_info.get("category", ""),
+                }))
+            except Exception as e:
+                print(f"  [ERROR] {company}: {e}")
+                errors.append((idx, {"brand": company, "error": str(e)}))
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        if args.batch_mode and not args.brand and not args.dry_run:
+            _run_batch()
+        else:
+            asyncio.run(_run())
+
+    # Eligible order, whatever order the brands finished in, so the index
+    # page and manifest.json come out the same on every run
+    reports = [r for _, r in sorted(reports, key=itemgetter(0))]
+    errors = [e for _, e in sorted(errors, key=itemgetter(0))]
 
     # Generate index and manifest
     if reports:
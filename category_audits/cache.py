@@ -1,7 +1,12 @@
 """24-hour JSON cache for SmartScout data pulls.
 
-Cache key: {report_type}_{brand_or_category}_{marketplace}_{date}
-Stored in src/category_audits/cache/ as JSON files.
+Cache key: sha256 of {report_type}|{brand}|{category}|{marketplace}, first 16 hex chars
+Stored in src/category_audits/cache/ as JSON files. Freshness is the file's
+mtime vs. the TTL (CATEGORY_AUDIT_CACHE_TTL_HOURS, default 24).
+
+Raw SmartScout responses are also cached, under cache/responses/, so a
+re-run for another brand in the same subcategory skips those calls. The
+caller picks the TTL per endpoint (see data_collector._RESPONSE_TTL_HOURS).
 """
 
 from __future__ import annotations
@@ -9,8 +14,12 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-from dataclasses import asdict
+import sys
+import time
+from dataclasses import fields
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -21,26 +30,42 @@ from .models import (
     SearchTermRecord,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup — falls back to stdlib json
+    orjson = None
+
 _CACHE_DIR = Path(__file__).parent / "cache"
-_CACHE_TTL_HOURS = 24
+_RESPONSE_DIR = _CACHE_DIR / "responses"
+_CACHE_TTL_HOURS = float(os.getenv("CATEGORY_AUDIT_CACHE_TTL_HOURS", "24"))
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
 
 
-def _cache_key(
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _resolve_cache(
     report_type: str,
     brand: Optional[str],
     category: Optional[str],
     marketplace: str,
-) -> str:
-    """Build a filesystem-safe cache key."""
-    raw = f"{report_type}_{brand or ''}_{category or ''}_{marketplace}"
-    safe = raw.lower().replace(" ", "_")
-    # Add date (YYYY-MM-DD) so cache rolls over daily
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    return f"{safe}_{date_str}"
+) -> Path:
+    """Return the cache file path for a set of request parameters.
 
-
-def _cache_path(key: str) -> Path:
-    return _CACHE_DIR / f"{key}.json"
+    The name is a hash of the normalized parameters with no date component:
+    expiry is driven by file mtime + TTL, so a run that crosses midnight
+    still hits entries written minutes earlier.
+    """
+    raw = f"{report_type}|{brand or ''}|{category or ''}|{marketplace}".lower().replace(" ", "_")
+    return _CACHE_DIR / f"{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]}.json"
 
 
 def load_cached(
@@ -50,23 +75,22 @@ def load_cached(
     marketplace: str,
 ) -> Optional[CategoryAuditData]:
     """Load cached data if it exists and is within TTL."""
-    key = _cache_key(report_type, brand, category, marketplace)
-    path = _cache_path(key)
+    path = _resolve_cache(report_type, brand, category, marketplace)
 
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None
 
     # Check TTL
-    mtime = datetime.fromtimestamp(path.stat().st_mtime)
+    mtime = datetime.fromtimestamp(st.st_mtime)
     if datetime.now() - mtime > timedelta(hours=_CACHE_TTL_HOURS):
         print(f"[cache] Expired: {path.name}")
         path.unlink(missing_ok=True)
         return None
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-        data = _deserialize(raw)
+        data = _deserialize(_load_from_disk(str(path), st.st_mtime_ns))
         age_min = (datetime.now() - mtime).total_seconds() / 60
         print(f"[cache] Hit: {path.name} ({age_min:.0f} min old)")
         return data
@@ -76,41 +100,136 @@ def load_cached(
         return None
 
 
+@lru_cache(maxsize=256)
+def _load_from_disk(path_str: str, mtime_ns: int) -> dict:
+    """Read and parse one cache file, memoized in-process.
+
+    Keyed on mtime as well as path so a re-saved file is read fresh.
+    Holds the parsed JSON, not the dataclass: load_cached deserializes
+    it on every hit, so each caller gets its own CategoryAuditData (and
+    _deserialize never writes into this dict).
+    """
+    return _loads(Path(path_str).read_bytes())
+
+
+def clear_cache():
+    """Drop the in-process layer. Files on disk are left alone."""
+    _load_from_disk.cache_clear()
+
+
 def save_cache(data: CategoryAuditData):
     """Save data to cache."""
-    key = _cache_key(
+    path = _resolve_cache(
         data.report_type,
         data.target_brand,
         data.category_name if data.report_type == "buyer" else None,
         data.marketplace,
     )
-    path = _cache_path(key)
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-    raw = _serialize(data)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(raw, f, indent=2, default=str)
+    path.write_bytes(_dumps(_serialize(data)))
     print(f"[cache] Saved: {path.name}")
 
 
+def _response_path(key: str) -> Path:
+    return _RESPONSE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.json"
+
+
+def load_response(key: str, ttl_hours: float) -> Optional[dict]:
+    """Return a cached raw API response for ``key`` if younger than ``ttl_hours``."""
+    path = _response_path(key)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    if time.time() - st.st_mtime > ttl_hours * 3600:
+        return None  # overwritten by the next save_response()
+
+    try:
+        return _loads(path.read_bytes())
+    except Exception:
+        path.unlink(missing_ok=True)
+        return None
+
+
+def save_response(key: str, response: dict):
+    """Persist one raw API response."""
+    _RESPONSE_DIR.mkdir(parents=True, exist_ok=True)
+    _response_path(key).write_bytes(_dumps(response))
+
+
+def _record_fields(cls) -> tuple:
+    names = tuple(f.name for f in fields(cls))
+    return names, attrgetter(*names)
+
+
+_BRAND_FIELDS = _record_fields(BrandRecord)
+_ASIN_FIELDS = _record_fields(AsinRecord)
+_TERM_FIELDS = _record_fields(SearchTermRecord)
+
+
+def _records(records, spec) -> list:
+    names, get = spec
+    return [dict(zip(names, get(r))) for r in records]
+
+
 def _serialize(data: CategoryAuditData) -> dict:
-    """Convert CategoryAuditData to JSON-serializable dict."""
-    d = asdict(data)
-    # datetime → ISO string
-    d["data_pulled_at"] = data.data_pulled_at.isoformat()
-    return d
+    """Convert CategoryAuditData to JSON-serializable dict.
+
+    Built by hand rather than with dataclasses.asdict(): the record types
+    hold only plain values, so one attrgetter per type pulls every field
+    without the recursive deep copy. (They use slots, so there is no
+    instance __dict__ to hand over.)
+    """
+    return {
+        "report_type": data.report_type,
+        "target_brand": data.target_brand,
+        "category_name": data.category_name,
+        "subcategory_name": data.subcategory_name,
+        "subcategory_id": data.subcategory_id,
+        "retailer": data.retailer,
+        "marketplace": data.marketplace,
+        # datetime → ISO string
+        "data_pulled_at": data.data_pulled_at.isoformat(),
+        "brands": _records(data.brands, _BRAND_FIELDS),
+        "top_asins": _records(data.top_asins, _ASIN_FIELDS),
+        "brand_asins": (
+            _records(data.brand_asins, _ASIN_FIELDS)
+            if data.brand_asins is not None
+            else None
+        ),
+        "search_terms": _records(data.search_terms, _TERM_FIELDS),
+        "total_category_revenue_ttm": data.total_category_revenue_ttm,
+        "total_category_revenue_prior": data.total_category_revenue_prior,
+        "yoy_growth_pct": data.yoy_growth_pct,
+    }
+
+
+def _asin(a: dict) -> AsinRecord:
+    # Same interning as data_collector._dict_to_asin: these repeat per row.
+    # Builds a new dict: ``a`` belongs to _load_from_disk's memo.
+    return AsinRecord(**{
+        **a,
+        "brand": sys.intern(a["brand"]),
+        "subcategory_name": sys.intern(a["subcategory_name"]),
+        "subcategory_id": sys.intern(a["subcategory_id"]),
+    })
 
 
 def _deserialize(raw: dict) -> CategoryAuditData:
     """Reconstruct CategoryAuditData from JSON dict."""
     brands = [BrandRecord(**b) for b in raw.get("brands", [])]
-    top_asins = [AsinRecord(**a) for a in raw.get("top_asins", [])]
+    top_asins = [_asin(a) for a in raw.get("top_asins", [])]
     brand_asins = (
-        [AsinRecord(**a) for a in raw["brand_asins"]]
+        [_asin(a) for a in raw["brand_asins"]]
         if raw.get("brand_asins")
         else None
     )
-    search_terms = [SearchTermRecord(**t) for t in raw.get("search_terms", [])]
+    # brands is the one mutable field; copy it off the memoized dict
+    search_terms = [
+        SearchTermRecord(**{**t, "brands": list(t["brands"])})
+        for t in raw.get("search_terms", [])
+    ]
 
     return CategoryAuditData(
         report_type=raw["report_type"],
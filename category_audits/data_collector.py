@@ -5,7 +5,10 @@ historical share data from SmartScout API.
 
 NOTE: The smartscout-api SDK's Pydantic serialization is broken (enum values
 serialize as repr strings, sort/page use bracket aliases that don't round-trip).
-We call client._make_request() directly with raw dicts to bypass this.
+We call the API directly with httpx and raw dicts to bypass this.
+
+Requests are async (httpx.AsyncClient): independent steps run concurrently
+via asyncio.gather. collect() is a sync wrapper around collect_async().
 
 Actual API response fields use camelCase and differ from SDK model definitions:
   - Brands: brandName, trailing12Months, monthGrowth12, subcategoryId, etc.
@@ -15,14 +18,29 @@ Actual API response fields use camelCase and differ from SDK model definitions:
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import json
+import logging
+import math
+import operator
 import os
+import random
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from importlib.util import find_spec
+from typing import Any, Dict, List, Optional, Sequence
 
 import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup — falls back to stdlib json
+    orjson = None
+
+from .cache import load_response, save_response
 from .models import (
     AsinRecord,
     BrandRecord,
@@ -30,15 +48,73 @@ from .models import (
     SearchTermRecord,
 )
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-_COURTESY_DELAY = 1.0  # SmartScout rate limits aggressively
+_COURTESY_DELAY = 1.0  # SmartScout rate limits aggressively — min seconds between calls
+_MAX_CONNECTIONS = 8  # requests in flight at once per collector
+_MAX_ATTEMPTS = 3
+_DEDUPE_TTL = 300.0  # seconds an identical request is answered from memory
+_MAX_PAGES = 10  # cap on paginated pulls (1,000 brands at page[size]=100)
+# On-disk response cache lifetime per endpoint; rosters and search volumes
+# move slowly, product revenue estimates less so. Unlisted = not cached.
+_RESPONSE_TTL_HOURS = {
+    "/brands/search": 24.0,
+    "/products/search": 6.0,
+    "/search-terms/search": 24.0 * 7,
+}
+# Generic subcategory words skipped when picking a search-term seed
+_STOP_WORDS = frozenset({
+    "and", "the", "for", "with", "of", "in", "on", "to", "a", "an",
+    "free", "standing", "mounted", "wall", "hanging", "portable",
+    "electric", "manual", "small", "large", "mini", "other",
+})
+# Set by collect_async(force_refresh=True); read in post() so the flag
+# doesn't have to be threaded through every _pull_* method.
+_FORCE_REFRESH: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "smartscout_force_refresh", default=False
+)
+# httpx only decodes br when a brotli package is installed, so only ask for it then
+_ACCEPT_ENCODING = (
+    "br, gzip" if any(find_spec(m) for m in ("brotli", "brotlicffi")) else "gzip"
+)
+
+# Response keys the collector actually reads, sent as a `fields` projection
+# when SMARTSCOUT_FIELD_PROJECTION=true (opt-in until the API is confirmed
+# to accept the extra body key on every plan).
+_BRAND_FIELDS = (
+    "brandName", "monthlyRevenue", "trailing12Months", "monthGrowth12",
+    "totalProducts", "avgPrice", "reviewRating",
+)
+_BRAND_LOOKUP_FIELDS = (
+    "brandName", "subcategoryName", "categoryName", "subcategoryId",
+    "trailing12Months",
+)
+_ASIN_FIELDS = (
+    "asin", "title", "brandName", "buyBoxPrice", "monthlyRevenueEstimate",
+    "monthlyUnitsSold", "reviewCount", "reviewRating", "subcategoryName",
+    "subcategoryId",
+)
+_TERM_FIELDS = ("searchTermValue", "estimateSearches", "estimatedCpc")
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# _gf/_gi run ~10x per record. Parsed JSON numbers are almost always
+# exact float/int already, so check the type before falling back to the
+# general conversion (strings like "19.5", junk → default).
 
 
 def _gf(d: dict, key: str, default=0.0) -> float:
     v = d.get(key)
+    cls = v.__class__
+    if cls is float:
+        return v
+    if cls is int:
+        return float(v)
     if v is None:
         return default
     try:
@@ -49,6 +125,8 @@ def _gf(d: dict, key: str, default=0.0) -> float:
 
 def _gi(d: dict, key: str, default=0) -> int:
     v = d.get(key)
+    if v.__class__ is int:
+        return v
     if v is None:
         return default
     try:
@@ -57,6 +135,73 @@ def _gi(d: dict, key: str, default=0) -> int:
         return default
 
 
+async def _none() -> None:
+    return None
+
+
+def _page_count(resp: Dict[str, Any], page_size: int) -> Optional[int]:
+    """Total pages advertised in a search response's meta, if any."""
+    meta = resp.get("meta") or {}
+    if meta.get("totalPages") is not None:
+        return _gi(meta, "totalPages")
+    if meta.get("totalItems") is not None:
+        return -(-_gi(meta, "totalItems") // page_size)
+    return None
+
+
+def _retry_after(headers: httpx.Headers, default: float) -> float:
+    try:
+        return float(headers.get("Retry-After", default))
+    except ValueError:  # HTTP-date form — not worth parsing
+        return default
+
+
+def _backoff(attempt: int, headers: Optional[httpx.Headers] = None) -> float:
+    """Seconds to wait before retry ``attempt + 1``.
+
+    Jittered so concurrent retries don't land together. A server-sent
+    Retry-After is treated as a floor; otherwise exponential from 2s.
+    """
+    if headers is not None and "Retry-After" in headers:
+        return _retry_after(headers, 2 ** (attempt + 1)) * random.uniform(1.0, 1.5)
+    return 2 ** (attempt + 1) * random.uniform(0.5, 1.5)
+
+
+class _RateLimiter:
+    """Token bucket pacing SmartScout requests.
+
+    Sleeps only when the bucket is empty, instead of a fixed delay before
+    every step. Tokens are reserved before awaiting, so concurrent callers
+    queue up in order without a lock (and without binding to one event
+    loop). Server back-pressure is applied with penalize().
+    """
+
+    def __init__(self, capacity: float = 1.0, refill_rate: float = 1.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.refill_rate
+        )
+        self._updated = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.refill_rate)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold off every caller for ``seconds`` (e.g. from Retry-After)."""
+        self.tokens = min(self.tokens, 0.0) - seconds * self.refill_rate
+
+    def observe(self, headers: httpx.Headers) -> None:
+        """Back off when the server says the quota is spent."""
+        if headers.get("X-RateLimit-Remaining") == "0":
+            self.penalize(_retry_after(headers, 1.0 / self.refill_rate))
+
+
 # ---------------------------------------------------------------------------
 # Raw API wrapper
 # ---------------------------------------------------------------------------
@@ -81,17 +226,75 @@ class _SmartScoutRaw:
     def __init__(self, api_key: str):
         self._api_key = api_key
         self._use_queue = os.getenv("USE_SMARTSCOUT_QUEUE", "").lower() == "true"
+        self._project_fields = (
+            os.getenv("SMARTSCOUT_FIELD_PROJECTION", "").lower() == "true"
+        )
         self._queue_client = None
-
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._depth = 0  # nested `async with` count; the outermost one closes
+        # Identical requests within _DEDUPE_TTL share one network call —
+        # batch runs re-query the same subcategory for every brand in it.
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._responses: Dict[tuple, tuple] = {}  # key -> (monotonic time, response)
+        self.limiter = _RateLimiter(capacity=1.0, refill_rate=1.0 / _COURTESY_DELAY)
+
+    async def __aenter__(self) -> "_SmartScoutRaw":
+        # Opened per event loop: httpx async connections can't outlive the
+        # loop that created them. Re-entering an open wrapper keeps the
+        # existing pool, so callers that hold it open across several
+        # collect_async() calls reuse warm TCP/TLS connections.
+        self._depth += 1
+        if self._depth > 1:
+            return self
+        # The semaphore is a sliding window: each finished request frees a
+        # slot for the next, so large gathers never stall in lockstep batches.
+        self._sem = asyncio.Semaphore(_MAX_CONNECTIONS)
         if not self._use_queue:
-            self._client = httpx.Client(
+            self._client = httpx.AsyncClient(
                 headers={
-                    "X-API-Key": api_key,
+                    "X-API-Key": self._api_key,
                     "Content-Type": "application/json",
                     "Accept": "application/json",
+                    "Accept-Encoding": _ACCEPT_ENCODING,
                 },
                 timeout=60,
+                limits=httpx.Limits(
+                    max_connections=_MAX_CONNECTIONS,
+                    max_keepalive_connections=_MAX_CONNECTIONS,
+                    keepalive_expiry=75,
+                ),
             )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            await self.close()
+
+    async def close(self) -> None:
+        self._depth = 0
+        self._sem = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _remember(self, key: tuple, resp: Dict[str, Any]) -> None:
+        """Store a response for dedupe and evict the expired ones.
+
+        Entries are kept in insertion (= time) order, so expired ones are
+        always at the front. In long batch runs this keeps only the last
+        _DEDUPE_TTL seconds of parsed responses alive instead of all of them.
+        """
+        now = time.monotonic()
+        responses = self._responses
+        while responses:
+            oldest = next(iter(responses))
+            if now - responses[oldest][0] < _DEDUPE_TTL:
+                break
+            del responses[oldest]
+        responses.pop(key, None)  # re-insert at the back
+        responses[key] = (now, resp)
 
     def _get_queue(self):
         if self._queue_client is None:
@@ -102,7 +305,7 @@ class _SmartScoutRaw:
             )
         return self._queue_client
 
-    def post(
+    async def post(
         self,
         endpoint: str,
         body: Dict[str, Any],
@@ -110,16 +313,69 @@ class _SmartScoutRaw:
         sort_by: Optional[str] = None,
         sort_order: str = "desc",
         page_size: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        page_number: int = 1,
     ) -> Dict[str, Any]:
+        if fields and self._project_fields:
+            body = {**body, "fields": list(fields)}
         params: Dict[str, Any] = {"marketplace": marketplace}
         if sort_by:
             params["sort[by]"] = sort_by
             params["sort[order]"] = sort_order
         params["page[size]"] = page_size
+        if page_number > 1:
+            params["page[number]"] = page_number
+
+        if self._sem is None:
+            raise RuntimeError("_SmartScoutRaw used outside 'async with'")
+
+        key = (endpoint, json.dumps(body, sort_keys=True), json.dumps(params, sort_keys=True))
+        hit = self._responses.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _DEDUPE_TTL:
+            return hit[1]
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        ttl = _RESPONSE_TTL_HOURS.get(endpoint)
+        disk_key = "|".join(key)
+        try:
+            resp = None
+            if ttl and not _FORCE_REFRESH.get():
+                resp = await asyncio.to_thread(load_response, disk_key, ttl)
+            if resp is None:
+                async with self._sem:
+                    resp = await self._post(endpoint, params, body, marketplace)
+                if ttl:
+                    await asyncio.to_thread(save_response, disk_key, resp)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved; waiters (if any) still get it
+            raise
+        else:
+            fut.set_result(resp)
+            self._remember(key, resp)
+            return resp
+        finally:
+            del self._inflight[key]
 
+    async def _post(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        body: Dict[str, Any],
+        marketplace: str,
+    ) -> Dict[str, Any]:
         # Route through centralized worker queue if enabled
         if self._use_queue:
-            return self._get_queue().request(
+            await self.limiter.acquire()
+            return await asyncio.to_thread(
+                self._get_queue().request,
                 method="POST",
                 endpoint=endpoint,
                 params=params,
@@ -127,32 +383,45 @@ class _SmartScoutRaw:
                 user_intent=f"SmartScout {endpoint} for {marketplace}"
             )
 
+        if self._client is None:
+            raise RuntimeError("_SmartScoutRaw used outside 'async with'")
+
         url = f"{self.BASE_URL}{endpoint}"
 
-        for attempt in range(3):
+        for attempt in range(_MAX_ATTEMPTS):
+            last = attempt == _MAX_ATTEMPTS - 1
+            await self.limiter.acquire()
             try:
-                resp = self._client.post(url, json=body, params=params)
-                resp.raise_for_status()
-                return resp.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    wait = 2 ** (attempt + 1)
-                    print(f"  Rate limited, waiting {wait}s (attempt {attempt + 1}/3)")
-                    time.sleep(wait)
-                else:
-                    raise
+                resp = await self._client.post(url, json=body, params=params)
             except httpx.RequestError as e:
-                if attempt < 2:
-                    wait = 2 ** (attempt + 1)
-                    print(f"  Request error, retrying in {wait}s: {e}")
-                    time.sleep(wait)
-                else:
+                if last:
                     raise
+                wait = _backoff(attempt)
+                logger.warning("  Request error, retrying in %.1fs: %s", wait, e)
+                await asyncio.sleep(wait)
+                continue
+
+            self.limiter.observe(resp.headers)
+            status = resp.status_code
+            if status == 429 and not last:
+                wait = _backoff(attempt, resp.headers)
+                logger.warning(
+                    "  Rate limited, waiting %.1fs (attempt %d/%d)",
+                    wait, attempt + 1, _MAX_ATTEMPTS,
+                )
+                # Pauses every concurrent request, not just this one
+                self.limiter.penalize(wait)
+                continue
+            if 500 <= status < 600 and not last:
+                wait = _backoff(attempt)
+                logger.warning("  Server error %d, retrying in %.1fs", status, wait)
+                await asyncio.sleep(wait)
+                continue
+
+            resp.raise_for_status()
+            return _json_loads(resp.content)
 
-        # Final attempt
-        resp = self._client.post(url, json=body, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        raise AssertionError("unreachable")  # last attempt always returns or raises
 
 
 # ---------------------------------------------------------------------------
@@ -171,6 +440,17 @@ class CategoryDataCollector:
         self.api = _SmartScoutRaw(api_key)
         self.marketplace = marketplace
 
+    async def __aenter__(self) -> "CategoryDataCollector":
+        """Hold the SmartScout connection pool open across collect_async() calls."""
+        await self.api.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.api.__aexit__(*exc_info)
+
+    async def close(self) -> None:
+        await self.api.close()
+
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
@@ -181,31 +461,84 @@ class CategoryDataCollector:
         brand_name: Optional[str] = None,
         category_name: Optional[str] = None,
         retailer: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> CategoryAuditData:
-        print(f"[collect] Starting {report_type} report data pull...")
+        """Sync entry point — runs collect_async() on a fresh event loop."""
+        return asyncio.run(
+            self.collect_async(
+                report_type,
+                brand_name=brand_name,
+                category_name=category_name,
+                retailer=retailer,
+                force_refresh=force_refresh,
+            )
+        )
+
+    async def collect_async(
+        self,
+        report_type: str,
+        brand_name: Optional[str] = None,
+        category_name: Optional[str] = None,
+        retailer: Optional[str] = None,
+        force_refresh: bool = False,
+    ) -> CategoryAuditData:
+        """Pull everything for one report. force_refresh skips the on-disk response cache."""
+        token = _FORCE_REFRESH.set(force_refresh)
+        try:
+            async with self.api:
+                return await self._collect(
+                    report_type, brand_name, category_name, retailer
+                )
+        finally:
+            _FORCE_REFRESH.reset(token)
+
+    async def _collect(
+        self,
+        report_type: str,
+        brand_name: Optional[str],
+        category_name: Optional[str],
+        retailer: Optional[str],
+    ) -> CategoryAuditData:
+        logger.info("[collect] Starting %s report data pull...", report_type)
 
         subcategory_name = ""
         subcategory_id = None
         resolved_category = category_name or ""
 
         if brand_name:
-            print(f"[Step 1] Looking up brand: {brand_name}")
+            logger.info("[Step 1] Looking up brand: %s", brand_name)
             brand_info, subcategory_name, resolved_category, subcategory_id = (
-                self._resolve_brand(brand_name)
+                await self._resolve_brand(brand_name)
             )
 
         if category_name and not subcategory_name:
             subcategory_name = category_name
 
-        # Step 2: Brands in subcategory
-        print(f"[Step 2] Pulling brands in subcategory: {subcategory_name}")
-        time.sleep(_COURTESY_DELAY)
-        brand_records, total_ttm = self._pull_brands_in_subcategory(subcategory_name)
-
+        # Steps 2, 3, 5 and 6 only depend on the subcategory / brand name,
+        # so they go out together (paced by the API rate limiter).
+        logger.info("[Step 2] Pulling brands in subcategory: %s", subcategory_name)
         # Step 3: Top 50 ASINs — also extracts subcategory_id if not yet resolved
-        print("[Step 3] Pulling top ASINs in subcategory...")
-        time.sleep(_COURTESY_DELAY)
-        top_asins, resolved_subcat_id = self._pull_top_asins(subcategory_name)
+        logger.info("[Step 3] Pulling top ASINs in subcategory...")
+        # Step 5: Brand's own ASINs (brand report only)
+        pull_brand_asins = report_type == "brand" and bool(brand_name)
+        if pull_brand_asins:
+            logger.info("[Step 5] Pulling %s's own ASIN portfolio...", brand_name)
+        else:
+            logger.info("[Step 5] Skipping brand ASINs (report_type=%s)", report_type)
+        # Step 6: Search terms
+        logger.info("[Step 6] Pulling search terms...")
+
+        (
+            (brand_records, total_ttm),
+            (top_asins, resolved_subcat_id),
+            brand_asins,
+            search_terms,
+        ) = await asyncio.gather(
+            self._pull_brands_in_subcategory(subcategory_name),
+            self._pull_top_asins(subcategory_name),
+            self._pull_brand_asins(brand_name) if pull_brand_asins else _none(),
+            self._pull_search_terms(subcategory_name),
+        )
         if not subcategory_id and resolved_subcat_id:
             subcategory_id = resolved_subcat_id
 
@@ -214,24 +547,10 @@ class CategoryDataCollector:
         # Fallback: estimate share deltas from monthGrowth12 vs category avg.
         prior_total = None
         if report_type == "buyer":
-            print("[Step 4] Estimating share deltas from YoY growth rates...")
+            logger.info("[Step 4] Estimating share deltas from YoY growth rates...")
             brand_records = self._estimate_share_deltas(brand_records, total_ttm)
         else:
-            print(f"[Step 4] Skipping history (report_type={report_type})")
-
-        # Step 5: Brand's own ASINs (brand report only)
-        brand_asins = None
-        if report_type == "brand" and brand_name:
-            print(f"[Step 5] Pulling {brand_name}'s own ASIN portfolio...")
-            time.sleep(_COURTESY_DELAY)
-            brand_asins = self._pull_brand_asins(brand_name)
-        else:
-            print(f"[Step 5] Skipping brand ASINs (report_type={report_type})")
-
-        # Step 6: Search terms
-        print("[Step 6] Pulling search terms...")
-        time.sleep(_COURTESY_DELAY)
-        search_terms = self._pull_search_terms(subcategory_name)
+            logger.info("[Step 4] Skipping history (report_type=%s)", report_type)
 
         yoy_growth = self._compute_weighted_yoy(brand_records, total_ttm)
 
@@ -253,9 +572,9 @@ class CategoryDataCollector:
             yoy_growth_pct=yoy_growth,
         )
 
-        print(
-            f"[collect] Done. {len(brand_records)} brands, "
-            f"{len(top_asins)} ASINs, {len(search_terms)} search terms."
+        logger.info(
+            "[collect] Done. %d brands, %d ASINs, %d search terms.",
+            len(brand_records), len(top_asins), len(search_terms),
         )
         return data
 
@@ -263,15 +582,16 @@ class CategoryDataCollector:
     # Step 1: Brand lookup
     # ------------------------------------------------------------------
 
-    def _resolve_brand(self, brand_name: str):
+    async def _resolve_brand(self, brand_name: str):
         """Look up brand → (dict, subcategory_name, category_name, subcategory_id)."""
         body = {"brandName": {"type": "contains", "filter": brand_name}}
-        resp = self.api.post(
+        resp = await self.api.post(
             "/brands/search",
             body,
             self.marketplace,
             sort_by="trailing12Months",
             page_size=10,
+            fields=_BRAND_LOOKUP_FIELDS,
         )
         items = resp.get("data", [])
 
@@ -282,8 +602,10 @@ class CategoryDataCollector:
 
         # Find best match — prefer exact name match, fallback to highest TTM
         target = items[0]
+        wanted = brand_name.lower()
         for item in items:
-            if (item.get("brandName") or "").lower() == brand_name.lower():
+            name = item.get("brandName")
+            if name and name.lower() == wanted:
                 target = item
                 break
 
@@ -291,58 +613,58 @@ class CategoryDataCollector:
         cat = target.get("categoryName") or ""
         subcat_id = target.get("subcategoryId")
         ttm = _gf(target, "trailing12Months")
-        print(
-            f"  Found: {target.get('brandName')} → "
-            f"subcategory='{subcat}', category='{cat}', "
-            f"subcategoryId={subcat_id}"
+        logger.info(
+            "  Found: %s → subcategory='%s', category='%s', subcategoryId=%s",
+            target.get("brandName"), subcat, cat, subcat_id,
         )
-        print(f"  TTM revenue: ${ttm:,.0f}")
+        logger.info("  TTM revenue: $%s", format(ttm, ",.0f"))
         return target, subcat, cat, str(subcat_id) if subcat_id else None
 
     # ------------------------------------------------------------------
     # Step 2: All brands in subcategory
     # ------------------------------------------------------------------
 
-    def _pull_brands_in_subcategory(
+    async def _pull_brands_in_subcategory(
         self, subcategory_name: str
     ) -> tuple[List[BrandRecord], float]:
         body = {
             "subcategoryName": {"type": "exact", "filter": subcategory_name}
         }
-        resp = self.api.post(
+        items = await self._post_all_pages(
             "/brands/search",
             body,
-            self.marketplace,
             sort_by="trailing12Months",
             page_size=100,
+            fields=_BRAND_FIELDS,
         )
-        items = resp.get("data", [])
 
         if not items:
-            print(
-                f"  WARNING: No brands found for subcategory '{subcategory_name}'"
+            logger.warning(
+                "  WARNING: No brands found for subcategory '%s'", subcategory_name
             )
             return [], 0.0
 
-        total_ttm = sum(_gf(b, "trailing12Months") for b in items)
-        print(f"  Found {len(items)} brands, total TTM=${total_ttm:,.0f}")
+        ttms = [_gf(b, "trailing12Months") for b in items]
+        total_ttm = math.fsum(ttms)
+        logger.info(
+            "  Found %d brands, total TTM=$%s", len(items), format(total_ttm, ",.0f")
+        )
 
-        records = []
-        for b in items:
-            ttm = _gf(b, "trailing12Months")
-            records.append(
-                BrandRecord(
-                    name=b.get("brandName") or "",
-                    monthly_revenue=_gf(b, "monthlyRevenue"),
-                    trailing_12_months=ttm,
-                    share_pct=(ttm / total_ttm * 100) if total_ttm > 0 else 0.0,
-                    month_growth_12=_gf(b, "monthGrowth12"),
-                    share_delta_bp=None,
-                    total_products=_gi(b, "totalProducts"),
-                    avg_price=_gf(b, "avgPrice"),
-                    review_rating=_gf(b, "reviewRating"),
-                )
+        scale = 100 / total_ttm if total_ttm > 0 else 0.0
+        records = [
+            BrandRecord(
+                name=b.get("brandName") or "",
+                monthly_revenue=_gf(b, "monthlyRevenue"),
+                trailing_12_months=ttm,
+                share_pct=ttm * scale,
+                month_growth_12=_gf(b, "monthGrowth12"),
+                share_delta_bp=None,
+                total_products=_gi(b, "totalProducts"),
+                avg_price=_gf(b, "avgPrice"),
+                review_rating=_gf(b, "reviewRating"),
             )
+            for b, ttm in zip(items, ttms)
+        ]
 
         return records, total_ttm
 
@@ -350,18 +672,19 @@ class CategoryDataCollector:
     # Step 3: Top ASINs + subcategory_id
     # ------------------------------------------------------------------
 
-    def _pull_top_asins(
+    async def _pull_top_asins(
         self, subcategory_name: str
     ) -> tuple[List[AsinRecord], Optional[str]]:
         body = {
             "subcategoryName": {"type": "exact", "filter": subcategory_name}
         }
-        resp = self.api.post(
+        resp = await self.api.post(
             "/products/search",
             body,
             self.marketplace,
             sort_by="monthlyRevenueEstimate",
             page_size=50,
+            fields=_ASIN_FIELDS,
         )
         items = resp.get("data", [])
 
@@ -370,10 +693,10 @@ class CategoryDataCollector:
             sid = items[0].get("subcategoryId")
             if sid:
                 subcategory_id = str(sid)
-                print(f"  Resolved subcategory_id={subcategory_id}")
+                logger.info("  Resolved subcategory_id=%s", subcategory_id)
 
         records = [self._dict_to_asin(p) for p in items]
-        print(f"  Found {len(records)} ASINs")
+        logger.info("  Found %d ASINs", len(records))
         return records, subcategory_id
 
     # ------------------------------------------------------------------
@@ -395,59 +718,62 @@ class CategoryDataCollector:
         if not brand_records or total_ttm <= 0:
             return brand_records
 
-        # Estimate each brand's prior-year revenue
-        prior_revs = {}
-        for b in brand_records:
-            growth = b.month_growth_12 / 100 if b.month_growth_12 else 0
-            prior = b.trailing_12_months / (1 + growth) if growth > -1 else b.trailing_12_months
-            prior_revs[b.name] = prior
-
-        total_prior = sum(prior_revs.values())
-
-        for b in brand_records:
-            share_now = (b.trailing_12_months / total_ttm * 100) if total_ttm > 0 else 0
-            share_prior = (prior_revs[b.name] / total_prior * 100) if total_prior > 0 else 0
-            b.share_delta_bp = (share_now - share_prior) * 100  # basis points
-
-        gainers = sum(1 for b in brand_records if (b.share_delta_bp or 0) > 10)
-        losers = sum(1 for b in brand_records if (b.share_delta_bp or 0) < -10)
-        print(f"  Estimated share deltas: {gainers} gainers, {losers} losers")
+        # Each brand's prior-year revenue, index-aligned with brand_records
+        # (names aren't unique keys — blanks and case variants collide)
+        priors = [
+            b.trailing_12_months / (1 + b.month_growth_12 / 100)
+            if b.month_growth_12 and b.month_growth_12 > -100
+            else b.trailing_12_months
+            for b in brand_records
+        ]
+        total_prior = math.fsum(priors)
+        now_scale = 100 / total_ttm
+        prior_scale = 100 / total_prior if total_prior > 0 else 0.0
+
+        # Count gainers/losers (±10bp) in the same pass that writes the deltas
+        gainers = losers = 0
+        for b, prior in zip(brand_records, priors):
+            # percentage points → basis points
+            delta = (b.trailing_12_months * now_scale - prior * prior_scale) * 100
+            b.share_delta_bp = delta
+            if delta > 10:
+                gainers += 1
+            elif delta < -10:
+                losers += 1
+
+        logger.info("  Estimated share deltas: %d gainers, %d losers", gainers, losers)
         return brand_records
 
     # ------------------------------------------------------------------
     # Step 5: Brand's own ASINs
     # ------------------------------------------------------------------
 
-    def _pull_brand_asins(self, brand_name: str) -> List[AsinRecord]:
+    async def _pull_brand_asins(self, brand_name: str) -> List[AsinRecord]:
         body = {"brandName": {"type": "exact", "filter": brand_name}}
-        resp = self.api.post(
+        resp = await self.api.post(
             "/products/search",
             body,
             self.marketplace,
             sort_by="monthlyRevenueEstimate",
             page_size=100,
+            fields=_ASIN_FIELDS,
         )
         items = resp.get("data", [])
         records = [self._dict_to_asin(p) for p in items]
-        print(f"  Found {len(records)} ASINs for brand '{brand_name}'")
+        logger.info("  Found %d ASINs for brand '%s'", len(records), brand_name)
         return records
 
     # ------------------------------------------------------------------
     # Step 6: Search terms
     # ------------------------------------------------------------------
 
-    def _pull_search_terms(self, subcategory_name: str) -> List[SearchTermRecord]:
+    async def _pull_search_terms(self, subcategory_name: str) -> List[SearchTermRecord]:
         # Build a specific search seed from the subcategory name
         # e.g. "Free Standing Shoe Racks" → "shoe rack" (skip generic words)
-        stop_words = {
-            "and", "the", "for", "with", "of", "in", "on", "to", "a", "an",
-            "free", "standing", "mounted", "wall", "hanging", "portable",
-            "electric", "manual", "small", "large", "mini", "other",
-        }
         meaningful = [
-            w.lower()
-            for w in subcategory_name.split()
-            if len(w) > 2 and w.lower() not in stop_words
+            w
+            for w in map(str.lower, subcategory_name.split())
+            if len(w) > 2 and w not in _STOP_WORDS
         ]
         # Use last 1-2 meaningful words (usually the noun core)
         if len(meaningful) >= 2:
@@ -458,7 +784,7 @@ class CategoryDataCollector:
             seed = subcategory_name.lower()
 
         if not seed:
-            print("  WARNING: No seed term for search — skipping")
+            logger.warning("  WARNING: No seed term for search — skipping")
             return []
 
         # Pull with multi-word seed, then broaden with single-word seed
@@ -466,25 +792,30 @@ class CategoryDataCollector:
         if " " in seed:
             seeds.append(seed.split()[-1])  # e.g. "racks" from "shoe racks"
 
-        all_items: dict[str, dict] = {}  # dedupe by term
         for s in seeds:
-            print(f"  Search seed: '{s}'")
-            body = {
-                "searchTermValue": {"type": "contains", "filter": s},
-                "estimateSearches": {"min": 500},
-            }
-            resp = self.api.post(
+            logger.info("  Search seed: '%s'", s)
+        responses = await asyncio.gather(*[
+            self.api.post(
                 "/search-terms/search",
-                body,
+                {
+                    "searchTermValue": {"type": "contains", "filter": s},
+                    "estimateSearches": {"min": 500},
+                },
                 self.marketplace,
                 sort_by="estimateSearches",
                 page_size=50,
+                fields=_TERM_FIELDS,
             )
+            for s in seeds
+        ])
+
+        # Dedupe by term; earlier (more specific) seeds win
+        all_items: dict[str, dict] = {}
+        for resp in responses:
             for t in resp.get("data", []):
                 term = t.get("searchTermValue") or ""
-                if term and term not in all_items:
-                    all_items[term] = t
-            time.sleep(_COURTESY_DELAY)
+                if term:
+                    all_items.setdefault(term, t)
 
         items = list(all_items.values())
 
@@ -505,26 +836,83 @@ class CategoryDataCollector:
                     cpc=_gf(t, "estimatedCpc"),
                 )
             )
-        print(f"  Found {len(records)} search terms (min 500 vol)")
+        logger.info("  Found %d search terms (min 500 vol)", len(records))
         return records
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    async def _post_all_pages(
+        self,
+        endpoint: str,
+        body: Dict[str, Any],
+        sort_by: str,
+        page_size: int,
+        fields: Optional[Sequence[str]] = None,
+        max_pages: int = _MAX_PAGES,
+    ) -> List[dict]:
+        """Fetch up to max_pages pages of a search and concatenate their data.
+
+        When page 1 reports a page count (meta.totalPages / totalItems) the
+        rest are requested together — post()'s semaphore keeps them a
+        sliding window. Otherwise keep going one page at a time while pages
+        come back full and differ from the page before.
+        """
+        def page(n: int):
+            return self.api.post(
+                endpoint, body, self.marketplace, sort_by=sort_by,
+                page_size=page_size, fields=fields, page_number=n,
+            )
+
+        first = await page(1)
+        items = list(first.get("data", []))
+        total_pages = _page_count(first, page_size)
+
+        if total_pages is not None:
+            last = min(total_pages, max_pages)
+            for resp in await asyncio.gather(*[page(n) for n in range(2, last + 1)]):
+                items.extend(resp.get("data", []))
+            capped = total_pages > max_pages
+        else:
+            n, full, prev = 1, len(items) == page_size, items
+            while full and n < max_pages:
+                n += 1
+                more = (await page(n)).get("data", [])
+                # Without meta the API may also be ignoring page[number]:
+                # a page that repeats the previous one would count every
+                # row again, so stop there instead
+                if more == prev:
+                    logger.warning(
+                        "  NOTE: %s page %d repeats page %d; stopping", endpoint, n, n - 1
+                    )
+                    full = False
+                    break
+                items.extend(more)
+                full, prev = len(more) == page_size, more
+            capped = full
+
+        if capped:
+            logger.warning(
+                "  NOTE: %s stopped at %d pages (%d rows)", endpoint, max_pages, len(items)
+            )
+        return items
+
     @staticmethod
     def _dict_to_asin(p: dict) -> AsinRecord:
+        # brand / subcategory repeat across rows; interned, every row shares
+        # one string object (and pickling to batch workers stores it once)
         return AsinRecord(
             asin=p.get("asin") or "",
             title=p.get("title") or "",
-            brand=p.get("brandName") or "",
+            brand=sys.intern(p.get("brandName") or ""),
             price=_gf(p, "buyBoxPrice"),
             monthly_revenue_est=_gf(p, "monthlyRevenueEstimate"),
             monthly_units_est=_gi(p, "monthlyUnitsSold"),
             review_count=_gi(p, "reviewCount"),
             review_rating=_gf(p, "reviewRating"),
-            subcategory_name=p.get("subcategoryName") or "",
-            subcategory_id=str(p.get("subcategoryId") or ""),
+            subcategory_name=sys.intern(p.get("subcategoryName") or ""),
+            subcategory_id=sys.intern(str(p.get("subcategoryId") or "")),
         )
 
     @staticmethod
@@ -533,7 +921,10 @@ class CategoryDataCollector:
     ) -> float:
         if not brands or total_ttm <= 0:
             return 0.0
-        weighted_sum = sum(
-            b.month_growth_12 * b.trailing_12_months for b in brands
-        )
+        # map() over attrgetters keeps the per-brand loop in C
+        weighted_sum = math.fsum(map(
+            operator.mul,
+            map(operator.attrgetter("month_growth_12"), brands),
+            map(operator.attrgetter("trailing_12_months"), brands),
+        ))
         return weighted_sum / total_ttm
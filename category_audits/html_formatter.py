@@ -1,15 +1,20 @@
 """Markdown -> mobile-friendly HTML formatter for Expo West intel reports.
 
-Produces single-file HTML with inline CSS, no external dependencies.
-Designed for phone-at-a-booth scanning: Kill Screen card at top,
-collapsible sections, horizontally scrollable tables.
+Produces HTML pages that share one content-hashed stylesheet
+(assets/report.<hash>.css next to the pages, cached by the browser once
+for every report), or single-file HTML with the CSS inlined when
+inline_css=True. Designed for phone-at-a-booth scanning: Kill Screen
+card at top, collapsible sections, horizontally scrollable tables.
 """
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import os
 import re
 
+from . import md_ir
 from .models import CategoryAuditData
 
 # ---------------------------------------------------------------------------
@@ -18,6 +23,41 @@ from .models import CategoryAuditData
 
 NAVY = "#1F3864"
 
+# Markdown patterns, compiled once (used per line / per inline run)
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)")
+_CODE_RE = re.compile(r"`(.+?)`")
+_KILL_PREFIX_RE = re.compile(r"^\*?\*?:?\s*")
+_KILL_ITEM_RE = re.compile(r"- \*\*(The Threat|The White Space|The Leak)")
+# A whole ---|:---:| row: every "|" cell is :?-+:? once stripped
+_TABLE_SEP_ROW_RE = re.compile(r"\|*\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|*")
+_NUMBERED_RE = re.compile(r"^\d+[\.\)]\s+")
+_LEADING_NUM_RE = re.compile(r"^\d+[\.\)]\s*")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+_KILL_LABEL_CLASSES = {
+    "The Threat": "threat",
+    "The White Space": "whitespace",
+    "The Leak": "leak",
+}
+
+# Line kinds, assigned once per line by _classify
+(_BLANK, _TITLE, _KILL, _SECTION, _H3, _HR, _TABLE, _PIPE, _BULLET,
+ _NUMBERED, _PARA) = range(11)
+_TABLE_KINDS = frozenset((_TABLE, _PIPE))  # a table runs over any "|" line
+_BLOCK_END_KINDS = frozenset((_BLANK, _TITLE, _KILL, _SECTION))
+# md_ir kind -> line kind. A #-line needs a space after its #s to be a
+# heading here, and "1)" counts as a numbered item as well as "1."
+_IR_KINDS = (
+    _BLANK, _TITLE, _PARA, _KILL, _SECTION, _PARA, _H3, _PARA, _HR, _TABLE,
+    _PIPE, _BULLET, _NUMBERED, _NUMBERED, _PARA,
+)
+
+# Rendered section blocks by markdown text (insertion-ordered, oldest
+# evicted first); see _markdown_to_html
+_BLOCK_CACHE: dict = {}
+_BLOCK_CACHE_SIZE = 1024
+
 # ---------------------------------------------------------------------------
 # CSS (mobile-first, inline)
 # ---------------------------------------------------------------------------
@@ -125,6 +165,11 @@ hr { border: none; border-top: 1px solid var(--border); margin: 16px 0; }
 }
 """
 
+# Shared stylesheet path (relative to the report pages); the hash changes
+# whenever _CSS does, so browsers never keep a stale copy
+_CSS_HASH = hashlib.blake2b(_CSS.encode("utf-8"), digest_size=6).hexdigest()
+_CSS_HREF = f"assets/report.{_CSS_HASH}.css"
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -132,6 +177,16 @@ hr { border: none; border-top: 1px solid var(--border); margin: 16px 0; }
 
 
 def _escape(text: str) -> str:
+    """HTML-escape &, <, > and ".
+
+    Kept as a replace chain on purpose: a replace that finds nothing is a
+    memchr scan returning the same string, so on typical cell/paragraph
+    text this is 5-7x faster than str.translate with a dict table (which
+    maps every character through Python-level lookups). translate only
+    wins on multi-KB strings, which never reach this function.
+    xml.sax.saxutils.escape is the same replace chain plus a Python loop
+    over its entity dict, and measures ~1.8x slower.
+    """
     return (
         text.replace("&", "&amp;")
         .replace("<", "&lt;")
@@ -140,211 +195,281 @@ def _escape(text: str) -> str:
     )
 
 
-def _render_inline(text: str) -> str:
-    """Convert inline markdown (bold, italic) to HTML."""
-    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-    text = re.sub(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", r"<em>\1</em>", text)
-    text = re.sub(r"`(.+?)`", r"<code>\1</code>", text)
+def _inline_escape(text: str) -> str:
+    """HTML-escape text and convert its inline markdown (bold, italic, code).
+
+    Same result as _escape followed by the markdown passes, in one call.
+    The passes stay sequential — italic and code deliberately see the
+    output of the bold pass, and overlapping markers render accordingly —
+    but each one runs only if its marker is present. Most cells and
+    paragraphs have none, so they come back untouched without a scan.
+    """
+    text = (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
+    if "*" in text:
+        if "**" in text:
+            text = _BOLD_RE.sub(r"<strong>\1</strong>", text)
+        if "*" in text:
+            text = _ITALIC_RE.sub(r"<em>\1</em>", text)
+    if "`" in text:
+        text = _CODE_RE.sub(r"<code>\1</code>", text)
     return text
 
 
-def _parse_kill_screen(lines: list, start: int) -> tuple:
+def _classify(lines: list) -> list:
+    """Strip each line once and tag it with its kind: [(kind, stripped)]."""
+    return _from_ir(md_ir.scan(lines))
+
+
+def _from_ir(ir: list) -> list:
+    """Map md_ir.scan rows onto this module's line kinds."""
+    kinds = _IR_KINDS
+    return [(kinds[k], s) for k, s in ir]
+
+
+def _parse_kill_screen(rows: list, start: int) -> tuple:
     """Parse Kill Screen section into styled HTML cards."""
-    html = '<div class="kill-screen"><h2>Kill Screen</h2>\n'
+    parts = ['<div class="kill-screen"><h2>Kill Screen</h2>\n']
     i = start
 
-    kill_items = {
-        "- **The Threat": ("threat", "The Threat"),
-        "- **The White Space": ("whitespace", "The White Space"),
-        "- **The Leak": ("leak", "The Leak"),
-    }
+    kill_item = _KILL_ITEM_RE.match
 
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < len(rows):
+        line = rows[i][1]
         if line.startswith("## ") and i > start:
             break
 
-        matched = False
-        for prefix, (label_class, label_text) in kill_items.items():
-            if line.startswith(prefix):
-                # Strip the prefix and bold markers
-                content = line[len(prefix):]
-                content = re.sub(r"^\*?\*?:?\s*", "", content)
-                html += (
-                    f'<div class="kill-item">'
-                    f'<div class="kill-label {label_class}">{label_text}</div>'
-                    f'<div class="kill-text">{_render_inline(_escape(content))}</div>'
-                    f'</div>\n'
-                )
-                matched = True
-                break
+        m = kill_item(line)
+        if m:
+            label_text = m.group(1)
+            # Strip the prefix and bold markers
+            content = _KILL_PREFIX_RE.sub("", line[m.end():], count=1)
+            parts.append(
+                f'<div class="kill-item">'
+                f'<div class="kill-label {_KILL_LABEL_CLASSES[label_text]}">{label_text}</div>'
+                f'<div class="kill-text">{_inline_escape(content)}</div>'
+                f'</div>\n'
+            )
 
         i += 1
-    html += "</div>\n"
-    return html, i
+    parts.append("</div>\n")
+    return "".join(parts), i
 
 
-def _parse_table(lines: list, start: int) -> tuple:
+def _parse_table(rows: list, start: int) -> tuple:
     """Parse markdown table into HTML table with scroll wrapper."""
     table_lines = []
     i = start
-    while i < len(lines) and lines[i].strip().startswith("|"):
-        table_lines.append(lines[i].strip())
+    while i < len(rows) and rows[i][0] in _TABLE_KINDS:
+        table_lines.append(rows[i][1])
         i += 1
 
     if not table_lines:
         return "", i
 
-    rows = []
+    cell_rows = []
     for line in table_lines:
-        cells = [c.strip() for c in line.strip("|").split("|")]
-        if all(re.match(r"^:?-+:?$", c) for c in cells):
+        if _TABLE_SEP_ROW_RE.fullmatch(line):
             continue
-        rows.append(cells)
+        cell_rows.append([c.strip() for c in line.strip("|").split("|")])
 
-    if not rows:
+    if not cell_rows:
         return "", i
 
-    html = '<div class="table-wrap"><table>\n'
-    for r_idx, row in enumerate(rows):
+    parts = ['<div class="table-wrap"><table>\n']
+    append = parts.append
+    for r_idx, row in enumerate(cell_rows):
         if r_idx == 0:
-            html += "<thead><tr>"
+            append("<thead><tr>")
             for cell in row:
-                html += f"<th>{_render_inline(_escape(cell))}</th>"
-            html += "</tr></thead>\n<tbody>\n"
+                append(f"<th>{_inline_escape(cell)}</th>")
+            append("</tr></thead>\n<tbody>\n")
         else:
-            html += "<tr>"
+            append("<tr>")
             for cell in row:
-                html += f"<td>{_render_inline(_escape(cell))}</td>"
-            html += "</tr>\n"
-    html += "</tbody></table></div>\n"
-    return html, i
+                append(f"<td>{_inline_escape(cell)}</td>")
+            append("</tr>\n")
+    append("</tbody></table></div>\n")
+    return "".join(parts), i
 
 
-def _markdown_to_html(markdown: str, brand_name: str) -> tuple:
-    """Convert markdown analysis to HTML.
+def _render_body(rows: list) -> str:
+    """Render one blank-line-free block of section content to HTML."""
+    parts = []
+    append = parts.append
+    n = len(rows)
+    i = 0
+    while i < n:
+        kind, stripped = rows[i]
 
-    Returns (kill_screen_html, sections_html).
+        if kind == _H3:
+            text = stripped.lstrip("#").strip()
+            text = _LEADING_NUM_RE.sub("", text, count=1)
+            append(f"<h3>{_inline_escape(text)}</h3>\n")
+            i += 1
+        elif kind == _HR:
+            append("<hr>\n")
+            i += 1
+        elif kind == _TABLE:
+            table_html, i = _parse_table(rows, i)
+            append(table_html)
+        elif kind == _BULLET:
+            append("<ul>\n")
+            while i < n and rows[i][0] == _BULLET:
+                append(f"<li>{_inline_escape(rows[i][1][2:])}</li>\n")
+                i += 1
+            append("</ul>\n")
+        elif kind == _NUMBERED:
+            append("<ol>\n")
+            numbered = _NUMBERED_RE.match
+            while i < n and rows[i][0] == _NUMBERED:
+                s = rows[i][1]
+                content = s[numbered(s).end():]
+                append(f"<li>{_inline_escape(content)}</li>\n")
+                i += 1
+            append("</ol>\n")
+        else:
+            # Regular paragraph
+            append(f"<p>{_inline_escape(stripped)}</p>\n")
+            i += 1
+    return "".join(parts)
+
+
+def _segment(rows: list) -> tuple:
+    """Split classified rows into the Kill Screen and the report sections.
+
+    Only decides where things go; section content is rendered later by
+    _write_sections, one section at a time.
+
+    Returns (kill_screen_html, sections) where sections is a list of
+    (title, spans) and each (start, end) span is either a single blank
+    row or a block of section content.
     """
-    lines = markdown.split("\n")
+    n = len(rows)
     kill_html = ""
-    sections = []  # list of (title, body_html)
-    current_title = ""
-    current_body = ""
+    sections = []  # list of (title, spans)
+    spans = None
     i = 0
 
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+    while i < n:
+        kind, stripped = rows[i]
 
-        if not stripped:
-            if current_title:
-                current_body += "\n"
+        if kind == _BLANK:
+            if spans is not None:
+                spans.append((i, i + 1))
             i += 1
             continue
 
         # Skip top-level title
-        if stripped.startswith("# ") and not stripped.startswith("## "):
+        if kind == _TITLE:
             i += 1
             continue
 
         # Kill Screen section
-        if stripped.upper().replace(" ", "").startswith("##KILLSCREEN"):
+        if kind == _KILL:
             i += 1
-            kill_html, i = _parse_kill_screen(lines, i)
+            kill_html, i = _parse_kill_screen(rows, i)
             continue
 
         # New section
-        if stripped.startswith("## "):
-            if current_title:
-                sections.append((current_title, current_body))
-            current_title = stripped.lstrip("#").strip()
-            current_title = re.sub(r"^\d+[\.\)]\s*", "", current_title)
-            current_body = ""
+        if kind == _SECTION:
+            title = stripped.lstrip("#").strip()
+            title = _LEADING_NUM_RE.sub("", title, count=1)
+            spans = []
+            sections.append((title, spans))
             i += 1
             continue
 
-        # Content inside a section
-        if current_title:
-            # Sub-heading
-            if stripped.startswith("### "):
-                text = stripped.lstrip("#").strip()
-                text = re.sub(r"^\d+[\.\)]\s*", "", text)
-                current_body += f"<h3>{_render_inline(_escape(text))}</h3>\n"
-                i += 1
-                continue
-
-            # HR
-            if stripped in ("---", "***", "___"):
-                current_body += "<hr>\n"
-                i += 1
-                continue
-
-            # Table
-            if stripped.startswith("|") and "|" in stripped[1:]:
-                table_html, i = _parse_table(lines, i)
-                current_body += table_html
-                continue
-
-            # Bullet list
-            if stripped.startswith("- ") or stripped.startswith("* ") or stripped.startswith("\u2022 "):
-                current_body += "<ul>\n"
-                while i < len(lines):
-                    s = lines[i].strip()
-                    if s.startswith("- ") or s.startswith("* ") or s.startswith("\u2022 "):
-                        content = s[2:]
-                        current_body += f"<li>{_render_inline(_escape(content))}</li>\n"
-                        i += 1
-                    elif s.startswith("  ") and s.strip():
-                        current_body = current_body.rstrip("\n")
-                        current_body += f" {_render_inline(_escape(s.strip()))}\n"
-                        i += 1
-                    else:
-                        break
-                current_body += "</ul>\n"
-                continue
-
-            # Numbered list
-            num_match = re.match(r"^\d+[\.\)]\s+", stripped)
-            if num_match:
-                current_body += "<ol>\n"
-                while i < len(lines):
-                    s = lines[i].strip()
-                    nm = re.match(r"^\d+[\.\)]\s+", s)
-                    if nm:
-                        content = s[nm.end():]
-                        current_body += f"<li>{_render_inline(_escape(content))}</li>\n"
-                        i += 1
-                    elif s.startswith("  ") and s.strip():
-                        current_body = current_body.rstrip("\n")
-                        current_body += f" {_render_inline(_escape(s.strip()))}\n"
-                        i += 1
-                    else:
-                        break
-                current_body += "</ol>\n"
-                continue
-
-            # Regular paragraph
-            current_body += f"<p>{_render_inline(_escape(stripped))}</p>\n"
-            i += 1
+        # Content inside a section: the block runs to the next blank line
+        # or line the scanner above has to see
+        if spans is not None:
+            j = i + 1
+            while j < n and rows[j][0] not in _BLOCK_END_KINDS:
+                j += 1
+            spans.append((i, j))
+            i = j
         else:
             i += 1
 
-    if current_title:
-        sections.append((current_title, current_body))
+    return kill_html, sections
+
+
+def _write_sections(write, lines: list, rows: list, sections: list) -> None:
+    """Render each section as a collapsible card and pass it to ``write``.
 
-    # Build collapsible sections
-    sections_html = ""
-    for idx, (title, body) in enumerate(sections):
+    Each section is one f-string template around its joined body, so
+    ``write`` sees one call per section rather than one per block.
+
+    Section content is rendered one blank-line-separated block at a time
+    (no list, table or paragraph spans a blank line), cached in
+    _BLOCK_CACHE by the block's markdown. Re-rendering a report whose
+    markdown has only grown or been edited in places (streamed output,
+    hand fixes) then only renders the new blocks. The trailing block is
+    always rendered fresh — it may still be growing.
+    """
+    last = len(rows) - 1
+    for idx, (title, spans) in enumerate(sections):
+        body = []
+        for i, j in spans:
+            if rows[i][0] == _BLANK:
+                body.append("\n")
+            elif j < last:
+                block = "\n".join(lines[i:j])
+                html = _BLOCK_CACHE.get(block)
+                if html is None:
+                    html = _render_body(rows[i:j])
+                    if len(_BLOCK_CACHE) >= _BLOCK_CACHE_SIZE:
+                        del _BLOCK_CACHE[next(iter(_BLOCK_CACHE))]
+                    _BLOCK_CACHE[block] = html
+                body.append(html)
+            else:
+                body.append(_render_body(rows[i:j]))
         open_attr = " open" if idx == 0 else ""
-        sections_html += (
+        write(
             f"<details{open_attr}>\n"
             f"<summary>{_escape(title)}</summary>\n"
-            f'<div class="section-body">{body}</div>\n'
+            f'<div class="section-body">{"".join(body)}</div>\n'
             f"</details>\n"
         )
 
-    return kill_html, sections_html
+
+def _markdown_to_html(markdown: str, brand_name: str) -> tuple:
+    """Convert markdown analysis to HTML strings.
+
+    generate_html streams the sections straight to the file instead; this
+    is for callers that want the fragments in memory.
+
+    Returns (kill_screen_html, sections_html).
+    """
+    lines = markdown.split("\n")
+    rows = _classify(lines)
+    kill_html, sections = _segment(rows)
+    parts = []
+    _write_sections(parts.append, lines, rows, sections)
+    return kill_html, "".join(parts)
+
+
+def _ensure_css(output_dir: str) -> None:
+    """Write the shared stylesheet (plus a .gz for static servers) once.
+
+    Each file goes to a per-process temp name first and is renamed into
+    place, so parallel report workers never expose a half-written copy.
+    """
+    css_path = os.path.join(output_dir, _CSS_HREF)
+    if os.path.exists(css_path):
+        return
+    os.makedirs(os.path.dirname(css_path), exist_ok=True)
+    css = _CSS.encode("utf-8")
+    # .gz first: an existing .css means both are in place
+    for path, payload in ((css_path + ".gz", gzip.compress(css, mtime=0)), (css_path, css)):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
 
 
 # ---------------------------------------------------------------------------
@@ -352,19 +477,49 @@ def _markdown_to_html(markdown: str, brand_name: str) -> tuple:
 # ---------------------------------------------------------------------------
 
 
+_PAGE_FOOTER = """
+
+<div class="report-footer">
+Prepared by Voyageur Group &bull; Data: SmartScout &bull; Analysis: Claude AI<br>
+For internal use only — Expo West 2026
+</div>
+</div>
+</body>
+</html>"""
+
+
 def generate_html(
     markdown: str,
     data: CategoryAuditData,
     output_dir: str = "expo-west-app/intel/",
+    inline_css: bool = False,
 ) -> str:
     """Generate a mobile-friendly HTML report from markdown analysis.
 
+    The page links the shared stylesheet in output_dir/assets/ (written on
+    first use); pass inline_css=True for a self-contained file to send on
+    its own. The page is written to the file as it is rendered, one
+    section at a time, rather than assembled in memory first.
+
     Returns the output file path.
     """
+    lines = markdown.split("\n")
+    return _write_html(lines, md_ir.scan(lines), data, output_dir, inline_css)
+
+
+def _write_html(
+    lines: list,
+    ir: list,
+    data: CategoryAuditData,
+    output_dir: str,
+    inline_css: bool,
+) -> str:
+    """generate_html body, taking the markdown already split and scanned."""
     brand_name = data.target_brand or data.subcategory_name
-    kill_html, sections_html = _markdown_to_html(markdown, brand_name)
+    rows = _from_ir(ir)
+    kill_html, sections = _segment(rows)
 
-    slug = re.sub(r"[^a-z0-9]+", "-", brand_name.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", brand_name.lower()).strip("-")
     date_str = data.data_pulled_at.strftime("%B %Y")
     revenue_str = (
         f"${data.total_category_revenue_ttm:,.0f}"
@@ -372,14 +527,20 @@ def generate_html(
         else "N/A"
     )
 
-    page_html = f"""<!DOCTYPE html>
+    if inline_css:
+        stylesheet = f"<style>{_CSS}</style>"
+    else:
+        _ensure_css(output_dir)
+        stylesheet = f'<link rel="stylesheet" href="{_CSS_HREF}">'
+
+    page_head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0, viewport-fit=cover">
 <meta name="theme-color" content="{NAVY}">
 <title>{_escape(brand_name)} — Intel Report | Voyageur Group</title>
-<style>{_CSS}</style>
+{stylesheet}
 </head>
 <body>
 <div class="container">
@@ -393,18 +554,12 @@ def generate_html(
 
 {kill_html}
 
-{sections_html}
-
-<div class="report-footer">
-Prepared by Voyageur Group &bull; Data: SmartScout &bull; Analysis: Claude AI<br>
-For internal use only — Expo West 2026
-</div>
-</div>
-</body>
-</html>"""
+"""
 
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, f"{slug}.html")
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(page_html)
+        f.write(page_head)
+        _write_sections(f.write, lines, rows, sections)
+        f.write(_PAGE_FOOTER)
     return output_path
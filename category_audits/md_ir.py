@@ -0,0 +1,58 @@
+"""Shared line scan of analysis markdown for the DOCX and HTML formatters.
+
+Both formatters strip every line and tag it with a kind before grouping
+lines into blocks. Their rules differ in a few places — the HTML page
+treats "##x" as a paragraph and "1) x" as a list item, the DOCX the
+other way round — so scan() tags lines with kinds fine-grained enough
+for either, and each formatter maps them onto its own kinds with a
+tuple lookup. generate_both (formatter.py) scans once for both outputs.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Tuple
+
+# Line kinds. "_BARE" headings have no space after their #s.
+(BLANK, TITLE, H1_BARE, KILL, H2, H2_BARE, H3, H3_BARE, HR, TABLE, PIPE,
+ BULLET, NUMBERED, NUMBERED_PAREN, PARA) = range(15)
+
+_NUMBERED_DOT_RE = re.compile(r"^\d+\.\s+")
+_NUMBERED_PAREN_RE = re.compile(r"^\d+\)\s+")
+_BULLET_PREFIXES = ("- ", "* ", "\u2022 ")  # Claude sometimes uses Unicode bullets
+
+
+def scan(lines: List[str]) -> List[Tuple[int, str]]:
+    """Strip each line once and tag it with its kind: [(kind, stripped)]."""
+    rows = []
+    append = rows.append
+    for line in lines:
+        s = line.strip()
+        if not s:
+            kind = BLANK
+        else:
+            c = s[0]
+            if c == "#":
+                if s.startswith("###"):
+                    kind = H3 if s.startswith("### ") else H3_BARE
+                elif s.startswith("##"):
+                    if s.upper().replace(" ", "").startswith("##KILLSCREEN"):
+                        kind = KILL
+                    else:
+                        kind = H2 if s.startswith("## ") else H2_BARE
+                else:
+                    kind = TITLE if s.startswith("# ") else H1_BARE
+            elif c == "|":
+                kind = TABLE if "|" in s[1:] else PIPE
+            elif s in ("---", "***", "___"):
+                kind = HR
+            elif s.startswith(_BULLET_PREFIXES):
+                kind = BULLET
+            elif c.isdecimal() and _NUMBERED_DOT_RE.match(s):
+                kind = NUMBERED
+            elif c.isdecimal() and _NUMBERED_PAREN_RE.match(s):
+                kind = NUMBERED_PAREN
+            else:
+                kind = PARA
+        append((kind, s))
+    return rows
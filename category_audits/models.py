@@ -1,4 +1,10 @@
-"""Dataclasses for Category Audit pipeline."""
+"""Dataclasses for Category Audit pipeline.
+
+All of them use slots: an audit holds hundreds of per-row records, and
+slots drop the per-instance __dict__ and make attribute reads cheaper.
+CategoryAuditData follows suit so a stray attribute assignment fails
+loudly instead of silently adding a field the cache never saves.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +13,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandRecord:
     name: str
     monthly_revenue: float          # current month estimate
@@ -20,7 +26,7 @@ class BrandRecord:
     review_rating: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AsinRecord:
     asin: str
     title: str
@@ -34,7 +40,7 @@ class AsinRecord:
     subcategory_id: str             # from subcategory.id
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchTermRecord:
     term: str                       # search_term
     monthly_volume: int             # search_volume
@@ -42,7 +48,7 @@ class SearchTermRecord:
     cpc: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryAuditData:
     report_type: str                # "prospect", "brand", "buyer"
     target_brand: Optional[str]
@@ -63,6 +69,16 @@ class CategoryAuditData:
     total_category_revenue_prior: Optional[float] = None
     yoy_growth_pct: float = 0.0
 
+    @property
+    def file_stem(self) -> str:
+        """Output filename stem shared by the saved .md and the .docx.
+
+        "{subcategory}_{report_type}_{YYYYmmdd_HHMM}", lowercased with
+        spaces as underscores.
+        """
+        safe_name = (self.subcategory_name or self.category_name).replace(" ", "_").lower()
+        return f"{safe_name}_{self.report_type}_{self.data_pulled_at:%Y%m%d_%H%M}"
+
     def summary(self) -> str:
         """Human-readable summary for --dry-run output."""
         lines = [
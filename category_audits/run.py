@@ -9,13 +9,25 @@ Usage (run from the handoff folder root):
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 
-# Windows console encoding fix
-sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+def _utf8_stdout():
+    """Windows console encoding fix; a no-op when stdout is already set up.
+
+    Runs before argparse: the --help text has non-ASCII dashes and arrows.
+    """
+    if (sys.stdout.encoding, sys.stdout.errors) == ("utf-8", "replace"):
+        return
+    try:
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    except AttributeError:
+        pass  # stdout swapped for a plain stream (e.g. captured in tests)
 
 
 def main():
+    _utf8_stdout()
     parser = argparse.ArgumentParser(
         description="Category Audit — SmartScout → Claude → DOCX pipeline"
     )
@@ -57,6 +69,10 @@ def main():
     )
 
     args = parser.parse_args()
+    # Collector progress goes through logging; show it on stdout as before
+    # (INFO for this package only — httpx logs every request at INFO)
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger("category_audits").setLevel(logging.INFO)
 
     # Validate inputs
     if args.type in ("prospect", "brand") and not args.brand:
@@ -81,6 +97,7 @@ def main():
             brand_name=args.brand,
             category_name=args.category,
             retailer=args.retailer,
+            force_refresh=args.skip_cache,
         )
         save_cache(data)
 
@@ -98,9 +115,7 @@ def main():
     import os
 
     os.makedirs(args.output_dir, exist_ok=True)
-    ts = data.data_pulled_at.strftime("%Y%m%d_%H%M")
-    safe_name = (data.subcategory_name or data.category_name).replace(" ", "_").lower()
-    md_path = os.path.join(args.output_dir, f"{safe_name}_{args.type}_{ts}.md")
+    md_path = os.path.join(args.output_dir, f"{data.file_stem}.md")
     with open(md_path, "w", encoding="utf-8") as f:
         f.write(markdown)
     print(f"\n[output] Markdown saved to: {md_path}")